@@ -8,28 +8,78 @@ using Discord's markdown formatting.
 
 Requirements:
 - requests
+- orjson (optional, faster JSON encoding/decoding)
 - datetime (built-in)
 - json (built-in)
 - os (built-in)
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import sys
+import time
+import hashlib
 import datetime
+import functools
+from collections import namedtuple
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
 
+# Prefer orjson when it is installed; fall back to the standard library
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
 # Configuration file
 CONFIG_FILE = "games_discord_config.json"
 
+# Flattened view of a RAWG game with only the fields the message needs
+GameRow = namedtuple("GameRow", "id name released platforms_str")
+
+# RAWG game fields kept after parsing; everything else is dropped
+RESULT_FIELDS = ("id", "name", "released", "platforms")
+
+# Fetches the core game fields in one C-level call; see _flatten
+_get_core_fields = itemgetter("id", "name", "released")
+
+# Directory for cached RAWG responses
+CACHE_DIR = "games_discord_cache"
+
+# How long cached RAWG responses stay fresh, in seconds
+GAMES_CACHE_TTL = 6 * 60 * 60
+
+# Discord rejects messages whose embeds contain more text than this in total
+DISCORD_EMBED_CHAR_LIMIT = 6000
+
+# Shared HTTP session so RAWG and Discord calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+SESSION.headers.update({
+    "User-Agent": "games-to-discord/1.0"
+})
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, str]:
     """Load configuration from file or create a new one."""
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            print(f"Error: {CONFIG_FILE} is corrupted. Creating a new one.")
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            return _loads(f.read())
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError:
+        print(f"Error: {CONFIG_FILE} is corrupted. Creating a new one.")
     
     # Default configuration
     config = {
@@ -47,7 +97,90 @@ def load_config() -> Dict[str, str]:
     
     return config
 
-def fetch_upcoming_games(api_key: str, count: int = 20) -> List[Dict[str, Any]]:
+def _cache_path(key: str) -> str:
+    """Return the cache file path for a key."""
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+def cache_get(key: str, ttl: int) -> Optional[Any]:
+    """
+    Read a value from the on-disk cache.
+    
+    Args:
+        key: Cache key
+        ttl: Maximum age of the cached value in seconds
+    
+    Returns:
+        The cached value, or None if it is missing, expired or unreadable
+    """
+    try:
+        with open(_cache_path(key), "r") as f:
+            entry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    
+    if time.time() - entry.get("ts", 0) > ttl:
+        return None
+    
+    return entry.get("data")
+
+def cache_set(key: str, value: Any) -> None:
+    """
+    Write a value to the on-disk cache.
+    
+    Args:
+        key: Cache key
+        value: JSON-serializable value to store
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(key), "w") as f:
+            json.dump({"ts": time.time(), "data": value}, f)
+    except OSError as e:
+        print(f"Warning: could not write cache entry: {str(e)}")
+
+def _flatten(results: List[Dict[str, Any]]) -> List[GameRow]:
+    """
+    Flatten RAWG game results into GameRow tuples.
+    
+    Platform names are joined once here so formatting only reads flat fields.
+    
+    Args:
+        results: List of game data dictionaries from RAWG.io
+    
+    Returns:
+        List of GameRow tuples
+    """
+    rows = []
+    for game in results:
+        # RAWG almost always includes these keys, so only fall back to .get() when one is missing
+        try:
+            game_id, name, released = _get_core_fields(game)
+        except KeyError:
+            game_id = game.get("id")
+            name = game.get("name", "Unknown Title")
+            released = game.get("released", "TBA")
+        
+        # Handle None platforms value by using empty list as fallback
+        platforms_list = game.get("platforms") or []
+        platform_names = []
+        append_name = platform_names.append
+        for p in platforms_list:
+            platform = p.get("platform")
+            if platform:
+                platform_name = platform.get("name")
+                if platform_name:
+                    append_name(platform_name)
+        rows.append(GameRow(
+            game_id,
+            name,
+            released,
+            # Many games share a platform list, so share one string per distinct list
+            sys.intern(", ".join(platform_names))
+        ))
+    
+    return rows
+
+def fetch_upcoming_games(api_key: str, count: int = 20) -> List[GameRow]:
     """
     Fetch upcoming games from RAWG.io API.
     
@@ -56,15 +189,11 @@ def fetch_upcoming_games(api_key: str, count: int = 20) -> List[Dict[str, Any]]:
         count: Number of games to fetch
     
     Returns:
-        List of game data dictionaries
+        List of GameRow tuples
     """
-    # Get today's date and 180 days in the future
+    # Date range from today to 180 days in the future, formatted for the API
     today = datetime.date.today()
-    future_date = today + datetime.timedelta(days=180)
-    
-    # Format dates for API
-    today_str = today.isoformat()
-    future_str = future_date.isoformat()
+    date_range = f"{today.isoformat()},{(today + datetime.timedelta(days=180)).isoformat()}"
     
     # API endpoint
     url = f"https://api.rawg.io/api/games"
@@ -72,26 +201,38 @@ def fetch_upcoming_games(api_key: str, count: int = 20) -> List[Dict[str, Any]]:
     # Parameters for the API request
     params = {
         "key": api_key,
-        "dates": f"{today_str},{future_str}",
+        "dates": date_range,
         "ordering": "released",
         "page_size": count
     }
     
+    # Serve from the cache when the same query was made recently
+    cache_key = json.dumps([url, sorted(params.items())])
+    cached = cache_get(cache_key, GAMES_CACHE_TTL)
+    if cached is not None:
+        return _flatten(cached)
+    
     try:
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params)
         response.raise_for_status()
-        data = response.json()
-        return data.get("results", [])
-    except requests.exceptions.RequestException as e:
+        data = _loads(response.content)
+        # Only keep the fields we use so the cache and memory stay small
+        results = [
+            {field: game[field] for field in RESULT_FIELDS if field in game}
+            for game in data.get("results", [])
+        ]
+        cache_set(cache_key, results)
+        return _flatten(results)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching games from RAWG.io: {str(e)}")
         return []
 
-def format_discord_message(games: List[Dict[str, Any]]) -> Dict[str, Any]:
+def format_discord_message(games: List[GameRow]) -> Dict[str, Any]:
     """
-    Format game data into a Discord message.
+    Format game rows into a Discord message.
     
     Args:
-        games: List of game data dictionaries
+        games: List of GameRow tuples
     
     Returns:
         Formatted Discord message payload
@@ -109,28 +250,54 @@ def format_discord_message(games: List[Dict[str, Any]]) -> Dict[str, Any]:
     
     # Add each game as a field
     for game in games:
-        name = game.get("name", "Unknown Title")
-        release_date = game.get("released", "TBA")
-        # Handle None platforms value by using empty list as fallback
-        platforms_list = game.get("platforms") or []
-        platforms = ", ".join([p.get("platform", {}).get("name", "") for p in platforms_list if p.get("platform")])
+        name = game.name
+        release_date = game.released
+        platforms = game.platforms_str
         
-        # Create field for this game
+        # Create field for this game, built as a single f-string
         field = {
             "name": f"**{name}**",
-            "value": f"📅 Release Date: **{release_date}**\n" +
-                     (f"🎮 Platforms: {platforms}" if platforms else "")
+            "value": f"📅 Release Date: **{release_date}**\n{'🎮 Platforms: ' if platforms else ''}{platforms}"
         }
         embed["fields"].append(field)
     
     # Create current timestamp for the footer
-    current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = f"{datetime.datetime.now():%Y-%m-%d %H:%M:%S}"
     embed["footer"] = {
         "text": f"Data from RAWG.io • Generated on {current_time}"
     }
     
     return {"embeds": [embed]}
 
+def _embed_text_length(embeds: List[Dict[str, Any]]) -> int:
+    """Count the characters Discord includes in its embed size limit."""
+    total = 0
+    for embed in embeds:
+        total += len(embed.get("title", "")) + len(embed.get("description", ""))
+        total += len(embed.get("footer", {}).get("text", ""))
+        for field in embed.get("fields", []):
+            total += len(field["name"]) + len(field["value"])
+    return total
+
+def _fit_embed_limit(payload: Dict[str, Any]) -> bool:
+    """
+    Drop trailing embed fields in place until the payload fits Discord's limit.
+    
+    Args:
+        payload: Formatted message payload
+    
+    Returns:
+        True if the payload fits the limit, False otherwise
+    """
+    embeds = payload.get("embeds", [])
+    total = _embed_text_length(embeds)
+    for embed in reversed(embeds):
+        fields = embed.get("fields", [])
+        while fields and total > DISCORD_EMBED_CHAR_LIMIT:
+            field = fields.pop()
+            total -= len(field["name"]) + len(field["value"])
+    return total <= DISCORD_EMBED_CHAR_LIMIT
+
 def send_to_discord(webhook_url: str, payload: Dict[str, Any]) -> bool:
     """
     Send formatted message to Discord webhook.
@@ -142,12 +309,20 @@ def send_to_discord(webhook_url: str, payload: Dict[str, Any]) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    # Discord would reject an oversized message, so check before sending
+    if not _fit_embed_limit(payload):
+        print(f"Error: message exceeds Discord's {DISCORD_EMBED_CHAR_LIMIT} character embed limit.")
+        return False
+    
+    # Serialize once so retries resend the same bytes
+    body = _dumps(payload)
     headers = {
-        "Content-Type": "application/json"
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body))
     }
     
     try:
-        response = requests.post(webhook_url, headers=headers, data=json.dumps(payload))
+        response = SESSION.post(webhook_url, headers=headers, data=body)
         response.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
@@ -8,28 +8,92 @@ in a readable way using Discord's markdown formatting and embeds a screenshot fo
 
 Requirements:
 - requests
+- orjson (optional, faster JSON encoding/decoding)
+- concurrent.futures (built-in)
 - datetime (built-in)
 - json (built-in)
 - os (built-in)
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import sys
+import time
+import hashlib
 import datetime
+import functools
+from collections import namedtuple
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 
+# Prefer orjson when it is installed; fall back to the standard library
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
 # Configuration file
 CONFIG_FILE = "games_discord_config.json"
 
+# Discord allows 10 embeds per message: 1 header embed plus this many games
+MAX_GAME_EMBEDS = 9
+
+# Flattened view of a RAWG game with only the fields the message needs
+GameRow = namedtuple("GameRow", "id name released platforms_str screenshot")
+
+# RAWG game fields kept after parsing; everything else is dropped
+RESULT_FIELDS = ("id", "name", "released", "platforms", "short_screenshots")
+
+# Static parts of each per-game embed
+_GAME_EMBED_TEMPLATE = {"color": 0x3498DB}  # Different color for game embeds
+_RELEASE_EMOJI = "\U0001F4C5"
+_PLATFORM_EMOJI = "\U0001F3AE"
+
+# Fetches the core game fields in one C-level call; see _flatten
+_get_core_fields = itemgetter("id", "name", "released")
+
+# Directory for cached RAWG responses
+CACHE_DIR = "games_discord_cache"
+
+# How long cached RAWG responses stay fresh, in seconds
+GAMES_CACHE_TTL = 6 * 60 * 60
+SCREENSHOT_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Discord rejects messages whose embeds contain more text than this in total
+DISCORD_EMBED_CHAR_LIMIT = 6000
+
+# Shared HTTP session so RAWG and Discord calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+SESSION.headers.update({
+    "User-Agent": "games-to-discord/1.0"
+})
+
+# Maximum number of screenshot requests in flight at once (RAWG rate limits)
+MAX_WORKERS = 8
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, str]:
     """Load configuration from file or create a new one."""
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            print(f"Error: {CONFIG_FILE} is corrupted. Creating a new one.")
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            return _loads(f.read())
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError:
+        print(f"Error: {CONFIG_FILE} is corrupted. Creating a new one.")
     
     # Default configuration
     config = {
@@ -47,7 +111,96 @@ def load_config() -> Dict[str, str]:
     
     return config
 
-def fetch_upcoming_games(api_key: str, count: int = 20) -> List[Dict[str, Any]]:
+def _cache_path(key: str) -> str:
+    """Return the cache file path for a key."""
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+def cache_get(key: str, ttl: int) -> Optional[Any]:
+    """
+    Read a value from the on-disk cache.
+    
+    Args:
+        key: Cache key
+        ttl: Maximum age of the cached value in seconds
+    
+    Returns:
+        The cached value, or None if it is missing, expired or unreadable
+    """
+    try:
+        with open(_cache_path(key), "r") as f:
+            entry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    
+    if time.time() - entry.get("ts", 0) > ttl:
+        return None
+    
+    return entry.get("data")
+
+def cache_set(key: str, value: Any) -> None:
+    """
+    Write a value to the on-disk cache.
+    
+    Args:
+        key: Cache key
+        value: JSON-serializable value to store
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(key), "w") as f:
+            json.dump({"ts": time.time(), "data": value}, f)
+    except OSError as e:
+        print(f"Warning: could not write cache entry: {str(e)}")
+
+def _flatten(results: List[Dict[str, Any]]) -> List[GameRow]:
+    """
+    Flatten RAWG game results into GameRow tuples.
+    
+    Platform names are joined once here so formatting only reads flat fields.
+    Screenshot URLs returned inline by RAWG are taken from short_screenshots.
+    
+    Args:
+        results: List of game data dictionaries from RAWG.io
+    
+    Returns:
+        List of GameRow tuples
+    """
+    rows = []
+    for game in results:
+        # RAWG almost always includes these keys, so only fall back to .get() when one is missing
+        try:
+            game_id, name, released = _get_core_fields(game)
+        except KeyError:
+            game_id = game.get("id")
+            name = game.get("name", "Unknown Title")
+            released = game.get("released", "TBA")
+        
+        # Handle None platforms value by using empty list as fallback
+        platforms_list = game.get("platforms") or []
+        platform_names = []
+        append_name = platform_names.append
+        for p in platforms_list:
+            platform = p.get("platform")
+            if platform:
+                platform_name = platform.get("name")
+                if platform_name:
+                    append_name(platform_name)
+        
+        # Keep the first inline screenshot, if RAWG returned any
+        short_screenshots = game.get("short_screenshots")
+        screenshot = short_screenshots[0].get("image") if short_screenshots else None
+        rows.append(GameRow(
+            game_id,
+            name,
+            released,
+            # Many games share a platform list, so share one string per distinct list
+            sys.intern(", ".join(platform_names)),
+            screenshot
+        ))
+    
+    return rows
+
+def fetch_upcoming_games(api_key: str, count: int = 20) -> List[GameRow]:
     """
     Fetch upcoming games from RAWG.io API.
     
@@ -56,15 +209,11 @@ def fetch_upcoming_games(api_key: str, count: int = 20) -> List[Dict[str, Any]]:
         count: Number of games to fetch
     
     Returns:
-        List of game data dictionaries
+        List of GameRow tuples
     """
-    # Get today's date and 180 days in the future
+    # Date range from today to 180 days in the future, formatted for the API
     today = datetime.date.today()
-    future_date = today + datetime.timedelta(days=180)
-    
-    # Format dates for API
-    today_str = today.isoformat()
-    future_str = future_date.isoformat()
+    date_range = f"{today.isoformat()},{(today + datetime.timedelta(days=180)).isoformat()}"
     
     # API endpoint
     url = f"https://api.rawg.io/api/games"
@@ -72,17 +221,31 @@ def fetch_upcoming_games(api_key: str, count: int = 20) -> List[Dict[str, Any]]:
     # Parameters for the API request
     params = {
         "key": api_key,
-        "dates": f"{today_str},{future_str}",
+        "dates": date_range,
         "ordering": "released",
-        "page_size": count
+        "page_size": count,
+        # Include screenshots inline to avoid a request per game
+        "short_screenshots": "true"
     }
     
+    # Serve from the cache when the same query was made recently
+    cache_key = json.dumps([url, sorted(params.items())])
+    cached = cache_get(cache_key, GAMES_CACHE_TTL)
+    if cached is not None:
+        return _flatten(cached)
+    
     try:
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params)
         response.raise_for_status()
-        data = response.json()
-        return data.get("results", [])
-    except requests.exceptions.RequestException as e:
+        data = _loads(response.content)
+        # Only keep the fields we use so the cache and memory stay small
+        results = [
+            {field: game[field] for field in RESULT_FIELDS if field in game}
+            for game in data.get("results", [])
+        ]
+        cache_set(cache_key, results)
+        return _flatten(results)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching games from RAWG.io: {str(e)}")
         return []
 
@@ -100,32 +263,72 @@ def fetch_game_screenshot(api_key: str, game_id: int) -> Optional[str]:
     # API endpoint for screenshots
     url = f"https://api.rawg.io/api/games/{game_id}/screenshots"
     
-    # Parameters for the API request
+    # Parameters for the API request; only the first screenshot is used
     params = {
-        "key": api_key
+        "key": api_key,
+        "page_size": 1
     }
     
+    # Screenshots rarely change, so keep them cached per game
+    cache_key = f"screenshot:{game_id}"
+    cached = cache_get(cache_key, SCREENSHOT_CACHE_TTL)
+    if cached is not None:
+        return cached
+    
     try:
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         results = data.get("results", [])
         
         # Return the URL of the first screenshot if available
         if results and len(results) > 0:
-            return results[0].get("image")
+            image = results[0].get("image")
+            if image:
+                cache_set(cache_key, image)
+            return image
         
         return None
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching screenshot for game {game_id}: {str(e)}")
         return None
 
-def format_discord_message(games: List[Dict[str, Any]], screenshots: Dict[int, str]) -> Dict[str, Any]:
+def fetch_screenshots(api_key: str, games: List[GameRow]) -> Dict[int, str]:
+    """
+    Fetch screenshots for several games concurrently.
+    
+    Args:
+        api_key: RAWG.io API key
+        games: List of GameRow tuples
+    
+    Returns:
+        Dictionary mapping game IDs to screenshot URLs
+    """
+    def fetch_one(game: GameRow) -> Optional[str]:
+        print(f"  Fetching screenshot for: {game.name}")
+        return fetch_game_screenshot(api_key, game.id)
+    
+    games_with_id = [game for game in games if game.id]
+    
+    # requests releases the GIL while waiting on the socket, so threads overlap the calls
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(fetch_one, games_with_id))
+    
+    screenshots = {}
+    for game, screenshot_url in zip(games_with_id, results):
+        if screenshot_url:
+            screenshots[game.id] = screenshot_url
+        else:
+            print(f"  No screenshot found for: {game.name}")
+    
+    return screenshots
+
+def format_discord_message(games: List[GameRow], screenshots: Dict[int, str]) -> Dict[str, Any]:
     """
-    Format game data into a Discord message with screenshots.
+    Format game rows into a Discord message with screenshots.
     
     Args:
-        games: List of game data dictionaries
+        games: List of GameRow tuples
         screenshots: Dictionary mapping game IDs to screenshot URLs
     
     Returns:
@@ -151,33 +354,29 @@ def format_discord_message(games: List[Dict[str, Any]], screenshots: Dict[int, s
     embeds.append(main_embed)
     
     # Create a separate embed for each game with its screenshot
-    # Limit to 9 games (+ 1 header embed = 10 total) to comply with Discord's limit of 10 embeds per message
-    for game in games[:9]:
-        game_id = game.get("id")
-        name = game.get("name", "Unknown Title")
-        release_date = game.get("released", "TBA")
-        # Handle None platforms value by using empty list as fallback
-        platforms_list = game.get("platforms") or []
-        platforms = ", ".join([p.get("platform", {}).get("name", "") for p in platforms_list if p.get("platform")])
+    # Limit to MAX_GAME_EMBEDS games (+ 1 header embed = 10 total) to comply with Discord's limit of 10 embeds per message
+    for game in games[:MAX_GAME_EMBEDS]:
+        game_id = game.id
+        name = game.name
+        release_date = game.released
+        platforms = game.platforms_str
         
-        # Create embed for this game
-        game_embed = {
-            "title": name,
-            "color": 0x3498DB,  # Different color for game embeds
-            "fields": [
-                {
-                    "name": "Release Date",
-                    "value": f"\U0001F4C5 **{release_date}**",
-                    "inline": True
-                }
-            ]
-        }
+        # Create embed for this game from the shared template
+        game_embed = _GAME_EMBED_TEMPLATE.copy()
+        game_embed["title"] = name
+        game_embed["fields"] = [
+            {
+                "name": "Release Date",
+                "value": f"{_RELEASE_EMOJI} **{release_date}**",
+                "inline": True
+            }
+        ]
         
         # Add platforms if available
         if platforms:
             game_embed["fields"].append({
                 "name": "Platforms",
-                "value": f"\U0001F3AE {platforms}",
+                "value": f"{_PLATFORM_EMOJI} {platforms}",
                 "inline": True
             })
         
@@ -195,13 +394,42 @@ def format_discord_message(games: List[Dict[str, Any]], screenshots: Dict[int, s
         embeds.append(game_embed)
     
     # Create current timestamp for the footer of the main embed
-    current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = f"{datetime.datetime.now():%Y-%m-%d %H:%M:%S}"
     embeds[0]["footer"] = {
         "text": f"Data from RAWG.io • Generated on {current_time}"
     }
     
     return {"embeds": embeds}
 
+def _embed_text_length(embeds: List[Dict[str, Any]]) -> int:
+    """Count the characters Discord includes in its embed size limit."""
+    total = 0
+    for embed in embeds:
+        total += len(embed.get("title", "")) + len(embed.get("description", ""))
+        total += len(embed.get("footer", {}).get("text", ""))
+        for field in embed.get("fields", []):
+            total += len(field["name"]) + len(field["value"])
+    return total
+
+def _fit_embed_limit(payload: Dict[str, Any]) -> bool:
+    """
+    Drop trailing game embeds in place until the payload fits Discord's limit.
+    
+    Whole game embeds are removed so no game is left without its release date.
+    The header embed is always kept.
+    
+    Args:
+        payload: Formatted message payload
+    
+    Returns:
+        True if the payload fits the limit, False otherwise
+    """
+    embeds = payload.get("embeds", [])
+    total = _embed_text_length(embeds)
+    while len(embeds) > 1 and total > DISCORD_EMBED_CHAR_LIMIT:
+        total -= _embed_text_length([embeds.pop()])
+    return total <= DISCORD_EMBED_CHAR_LIMIT
+
 def send_to_discord(webhook_url: str, payload: Dict[str, Any]) -> bool:
     """
     Send formatted message to Discord webhook.
@@ -213,12 +441,20 @@ def send_to_discord(webhook_url: str, payload: Dict[str, Any]) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    # Discord would reject an oversized message, so check before sending
+    if not _fit_embed_limit(payload):
+        print(f"Error: message exceeds Discord's {DISCORD_EMBED_CHAR_LIMIT} character embed limit.")
+        return False
+    
+    # Serialize once so retries resend the same bytes
+    body = _dumps(payload)
     headers = {
-        "Content-Type": "application/json"
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body))
     }
     
     try:
-        response = requests.post(webhook_url, headers=headers, data=json.dumps(payload))
+        response = SESSION.post(webhook_url, headers=headers, data=body)
         response.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
@@ -247,23 +483,19 @@ def main():
     
     print(f"Found {len(games)} upcoming games.")
     
-    # Fetch screenshots for each game
-    print("Fetching screenshots for games...")
-    screenshots = {}
-    for game in games:
-        game_id = game.get("id")
-        if game_id:
-            print(f"  Fetching screenshot for: {game.get('name', 'Unknown')}")
-            screenshot_url = fetch_game_screenshot(config["rawg_api_key"], game_id)
-            if screenshot_url:
-                screenshots[game_id] = screenshot_url
-            else:
-                print(f"  No screenshot found for: {game.get('name', 'Unknown')}")
+    # Use the screenshots returned inline with the game list
+    screenshots = {game.id: game.screenshot for game in games if game.id and game.screenshot}
+    
+    # Fall back to the screenshots endpoint for any shown game without one
+    missing = [game for game in games[:MAX_GAME_EMBEDS] if game.id and game.id not in screenshots]
+    if missing:
+        print("Fetching screenshots for games...")
+        screenshots.update(fetch_screenshots(config["rawg_api_key"], missing))
     
     print(f"Found screenshots for {len(screenshots)} out of {len(games)} games.")
     
     print("Formatting message for Discord...")
-    # Note: Only the first 9 games will be included in the Discord message due to Discord's embed limits
+    # Note: Only the first MAX_GAME_EMBEDS games will be included in the Discord message due to Discord's embed limits
     discord_payload = format_discord_message(games, screenshots)
     
     print("Sending message to Discord...")